@@ -72,6 +72,19 @@ if __name__ == "__main__":
     )
     print(f"[INFO] Numpy method took {numpy_end_time-numpy_start_time} seconds")
 
+    screened_start_time = time.perf_counter()
+    matches, no_matches = cross_matcher.screened_crossmatch(
+        bss_cat, super_cat, args.get("max_dist")
+    )
+    screened_end_time = time.perf_counter()
+    print(
+        f"[INFO] Screened method found {len(matches)} matches and "
+        f"{len(no_matches)} objects with no match"
+    )
+    print(
+        f"[INFO] Screened method took {screened_end_time-screened_start_time} seconds"
+    )
+
     kd_start_time = time.perf_counter()
     bss_cat = np.radians(np.asarray(bss_cat))
     super_cat = np.radians(np.asarray(super_cat))
@@ -0,0 +1,77 @@
+"""
+Sweeps the match radius, max_dist, to compare the number of matches with
+the number of chance matches found for a randomly offset control catalogue.
+Every radius is computed from a single crossmatch at the largest radius.
+"""
+import os
+import sys
+import argparse
+import numpy as np
+import src.utils.utils as utils
+from src.astro import sweep
+
+if __name__ == "__main__":
+
+    print("[INFO] Script started successfully")
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "-b",
+        "--bss_path",
+        type=str,
+        default="./cats/bss.dat",
+        help="file path to bss catalogue data",
+    )
+    ap.add_argument(
+        "-s",
+        "--super_path",
+        type=str,
+        default="./cats/super.csv",
+        help="file path to SuperCosmos catalogue data",
+    )
+    ap.add_argument(
+        "--min_dist",
+        type=float,
+        default=1 / 3600,
+        help="smallest match radius in degrees",
+    )
+    ap.add_argument(
+        "-d",
+        "--max_dist",
+        type=float,
+        default=80 / 3600,
+        help="largest match radius in degrees",
+    )
+    ap.add_argument(
+        "-n",
+        "--n_radii",
+        type=int,
+        default=50,
+        help="number of match radii to sweep",
+    )
+    args = vars(ap.parse_args())
+
+    if args.get("n_radii") < 1:
+        print("[ERR] The number of radii must be at least 1.")
+        sys.exit()
+
+    if not os.path.exists(args.get("bss_path")) or not os.path.exists(
+        args.get("super_path")
+    ):
+        print("[ERR] Cannot find catalogue directories.")
+        sys.exit()
+
+    bss_cat = utils.import_dat(args.get("bss_path"))
+    super_cat = utils.import_csv(args.get("super_path"))
+
+    print("[INFO] Loaded catalogue data")
+    print("[INFO] Start radius sweep")
+
+    radii = np.linspace(args.get("min_dist"), args.get("max_dist"), args.get("n_radii"))
+    table, _ = sweep.radius_sweep(bss_cat, super_cat, radii)
+
+    print("\tradius [arcsec] \t matched \t unmatched \t control matched")
+    for radius, n_matched, n_unmatched, n_control in table:
+        print(
+            f"\t{radius * 3600:.1f} \t\t\t {n_matched} \t\t {n_unmatched} \t\t {n_control}"
+        )
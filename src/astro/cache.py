@@ -0,0 +1,270 @@
+import os
+import glob
+import hashlib
+import functools
+from collections import OrderedDict
+import numpy as np
+from src.astro import cross_matcher
+
+
+def fingerprint(cat):
+    """
+    Hashes the contents of a catalogue so that identical catalogues share
+    cache entries, however they were loaded.
+
+    Args:
+        cat (list([float, float])): The right ascension and declination
+                                    of items in a catalogue
+
+    Returns:
+        str: Hex digest of the catalogue's shape and float64 values
+    """
+    arr = np.ascontiguousarray(np.asarray(cat, dtype=np.float64))
+    h = hashlib.sha256(str(arr.shape).encode())
+    h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+# Crossmatch functions known to return each object's nearest neighbour, whose
+# results at a smaller radius can be derived from a larger cached radius
+NEAREST_NEIGHBOUR_FUNCS = (
+    cross_matcher.naive_crossmatch,
+    cross_matcher.numpy_crossmatch,
+    cross_matcher.screened_crossmatch,
+)
+
+
+def func_key(func):
+    """
+    Names a crossmatch function for use in cache keys. Only module-level
+    functions have a name which identifies them uniquely: lambdas and
+    closures share a __qualname__ (e.g. "<lambda>") between instances, and
+    callables such as functools.partial objects have none. These need an
+    explicit key passed to CrossmatchCache.wrap().
+
+    Args:
+        func (function): Crossmatch function
+
+    Returns:
+        str: The name of func
+
+    Raises:
+        TypeError: If func has no unique name
+    """
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None or "<" in qualname:
+        raise TypeError(f"{func!r} has no unique name, pass key= to cache its results")
+    return f"{getattr(func, '__module__', '')}.{qualname}"
+
+
+def check_result(result, func):
+    """
+    Checks that a crossmatch result has the (matches, no_matches) form which
+    the cache knows how to store and shrink.
+
+    Args:
+        result (any): The value returned by func
+        func (function): The crossmatch function, used in the error message
+
+    Raises:
+        TypeError: If result isn't a (matches, no_matches) pair
+    """
+    try:
+        matches, no_matches = result
+        valid = all(isinstance(m, tuple) and len(m) == 3 for m in matches) and all(
+            isinstance(i, (int, np.integer)) for i in no_matches
+        )
+    except (TypeError, ValueError):
+        valid = False
+
+    if not valid:
+        raise TypeError(
+            f"{func_key(func)} must return (matches, no_matches) to be cached"
+        )
+
+
+class CrossmatchCache:
+    """
+    Opt-in memoization of crossmatch functions which return (matches,
+    no_matches), e.g. cross_matcher.numpy_crossmatch(). Results are keyed by
+    the function, the content hash of both catalogues and max_dist, and kept
+    in a bounded in-memory LRU and, optionally, an on-disk store.
+
+    For functions which return each object's nearest neighbour, a call with
+    a radius smaller than one already cached for the same catalogues is
+    answered from the larger result without recomputing. Other functions,
+    e.g. the k-d tree path which returns the first object found within
+    max_dist, are only answered from results cached at exactly max_dist.
+
+    Usage:
+        cache = CrossmatchCache(maxsize=32, cache_dir="./.crossmatch_cache")
+        crossmatch = cache.wrap(cross_matcher.numpy_crossmatch)
+        matches, no_matches = crossmatch(bss_cat, super_cat, 40 / 3600)
+    """
+
+    def __init__(self, maxsize=128, cache_dir=None):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of results held in memory.
+                                     Defaults to 128.
+            cache_dir (str, optional): Directory for the on-disk result store.
+                                       Defaults to None (memory only).
+        """
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self._results = OrderedDict()
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def wrap(self, func, key=None, nearest=None):
+        """
+        Wraps a crossmatch function so that its results are cached.
+
+        Args:
+            func (function): Crossmatch function with the signature
+                             func(bss_cat, super_cat, max_dist)
+            key (str, optional): Name identifying func in the cache. Defaults
+                                 to None, see func_key().
+            nearest (bool, optional): True if func returns each object's
+                                      nearest neighbour, allowing smaller
+                                      radii to be derived from cached results.
+                                      Defaults to None, which is True only
+                                      for NEAREST_NEIGHBOUR_FUNCS.
+
+        Returns:
+            function: Cached version of func with the same signature
+        """
+
+        @functools.wraps(func)
+        def cached_func(bss_cat, super_cat, max_dist):
+            return self.crossmatch(
+                func, bss_cat, super_cat, max_dist, key=key, nearest=nearest
+            )
+
+        return cached_func
+
+    def crossmatch(self, func, bss_cat, super_cat, max_dist, key=None, nearest=None):
+        """
+        Returns the cached result of func(bss_cat, super_cat, max_dist),
+        deriving it from a larger cached radius or computing it if needed.
+
+        Args:
+            func (function): Crossmatch function returning (matches, no_matches)
+            bss_cat (list([float, float])): Catalogue to cross-match
+            super_cat (list([float, float])): Catalogue to search for matches
+            max_dist (float): The maximum distance to consider a match
+            key (str, optional): Name identifying func in the cache. Defaults
+                                 to None, see func_key().
+            nearest (bool, optional): True if func returns each object's
+                                      nearest neighbour. Defaults to None,
+                                      see wrap().
+
+        Returns:
+            matches (list(tuple(int, int, float))): The result of func
+            no_matches (list(int)): The result of func
+
+        Raises:
+            TypeError: If func doesn't return (matches, no_matches), e.g.
+                       kd_tree.KD_crossmatch() which returns match indexes,
+                       or if no key is given and func has no unique name
+        """
+        prefix = (
+            func_key(func) if key is None else key,
+            fingerprint(bss_cat),
+            fingerprint(super_cat),
+        )
+        max_dist = float(max_dist)
+        if nearest is None:
+            nearest = func in NEAREST_NEIGHBOUR_FUNCS
+
+        result = self._get(prefix, max_dist, nearest)
+        if result is None:
+            result = func(bss_cat, super_cat, max_dist)
+            check_result(result, func)
+            self._put(prefix, max_dist, result)
+            self._save(prefix, max_dist, result)
+
+        # Hand out fresh lists so callers can't modify the cached result
+        return list(result[0]), list(result[1])
+
+    def clear(self):
+        """
+        Empties the in-memory cache. The on-disk store is left untouched.
+        """
+        self._results.clear()
+
+    def _get(self, prefix, max_dist, nearest):
+        key = prefix + (max_dist,)
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        # Smallest cached radius which is at least as large as max_dist
+        larger = [k[-1] for k in self._results if k[:-1] == prefix and k[-1] > max_dist]
+        if nearest and larger:
+            larger_key = prefix + (min(larger),)
+            self._results.move_to_end(larger_key)
+            result = cross_matcher.shrink_result(self._results[larger_key], max_dist)
+            self._put(prefix, max_dist, result)
+            return result
+
+        result = self._load(prefix, max_dist, nearest)
+        if result is not None:
+            self._put(prefix, max_dist, result)
+        return result
+
+    def _put(self, prefix, max_dist, result):
+        self._results[prefix + (max_dist,)] = result
+        self._results.move_to_end(prefix + (max_dist,))
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def _path(self, prefix, max_dist):
+        # The function key may contain characters which aren't valid in a
+        # file name, so hash it like the catalogues
+        func_hash = hashlib.sha256(prefix[0].encode()).hexdigest()
+        name = "-".join((func_hash[:16], prefix[1][:16], prefix[2][:16]))
+        return os.path.join(self.cache_dir, f"{name}-{max_dist.hex()}.npz")
+
+    def _save(self, prefix, max_dist, result):
+        if self.cache_dir is None:
+            return
+
+        matches, no_matches = result
+        np.savez(
+            self._path(prefix, max_dist),
+            bss_ids=np.asarray([m[0] for m in matches], dtype=np.int64),
+            super_ids=np.asarray([m[1] for m in matches], dtype=np.int64),
+            dists=np.asarray([m[2] for m in matches], dtype=np.float64),
+            no_matches=np.asarray(no_matches, dtype=np.int64),
+        )
+
+    def _load(self, prefix, max_dist, nearest):
+        if self.cache_dir is None:
+            return None
+
+        # Use the smallest stored radius which is at least as large as
+        # max_dist, or only max_dist itself if it can't be derived
+        exact = self._path(prefix, max_dist)
+        stem = exact[: -len(f"{max_dist.hex()}.npz")]
+        radii = []
+        for path in glob.glob(glob.escape(stem) + "*.npz"):
+            radius = float.fromhex(path[len(stem) : -len(".npz")])
+            if radius == max_dist or (nearest and radius > max_dist):
+                radii.append(radius)
+
+        if not radii:
+            return None
+
+        radius = min(radii)
+        with np.load(self._path(prefix, radius)) as data:
+            matches = [
+                (int(b), int(s), d)
+                for b, s, d in zip(data["bss_ids"], data["super_ids"], data["dists"])
+            ]
+            result = matches, [int(i) for i in data["no_matches"]]
+
+        if radius > max_dist:
+            result = cross_matcher.shrink_result(result, max_dist)
+        return result
@@ -107,3 +107,92 @@ def numpy_crossmatch(bss_cat, super_cat, max_dist):
             matches.append((bss_id, min_id, min_dist))
 
     return matches, no_matches
+
+
+# Relative slack on the squared match radius used when screening candidates.
+# Pairs whose screened distance falls inside this band are always sent to the
+# exact Haversine check, absorbing any floating point rounding in the screen.
+SCREEN_RTOL = 1e-6
+
+
+def screened_crossmatch(bss_cat, super_cat, max_dist):
+    """
+    Same matching as numpy_crossmatch(), but candidates are first screened
+    with a cheap, vectorised flat-sky distance (corrected for cos(Dec)) over
+    the whole of super_cat at once. The exact Haversine distance is then only
+    computed for the few candidates which survive the screen.
+
+    The screen is a guaranteed lower bound on the true angular distance (see
+    utils.screen_dist_sq()), so it only ever rejects pairs which could not
+    have matched. The survivors are passed to find_closest(), just as in
+    numpy_crossmatch(), so the accept/reject decisions, matched ids and
+    distances are identical to it.
+
+    Args:
+        bss_cat (list([float, float])): The right ascension and declination
+                                        of items in the bss catalogue in degrees
+        super_cat (list([float, float])): The right ascension and declination
+                                          of items in the SuperCosmos catalogue
+                                          in degrees
+        max_dist (float): The maximum distance in degrees to consider a match
+
+    Returns:
+        matches (list(tuple(int, int, float))): The index of the bss object, the
+                                                index of its nearest super object
+                                                and their distance in degrees
+        no_matches (list(int)): The indexes of bss objects with no match
+    """
+    matches = []
+    no_matches = []
+
+    bss_cat = np.radians(np.asarray(bss_cat))
+    super_cat = np.radians(np.asarray(super_cat)).reshape(-1, 2)
+    super_ra, super_dec = super_cat[:, 0], super_cat[:, 1]
+    super_cos = np.cos(super_dec)
+
+    max_dist_sq = np.radians(max_dist) ** 2 * (1 + SCREEN_RTOL)
+
+    for bss_id, (bss_ra, bss_dec) in enumerate(bss_cat):
+        cos_min = np.minimum(super_cos, np.cos(bss_dec))
+        screen = utils.screen_dist_sq(super_ra, super_dec, bss_ra, bss_dec, cos_min)
+        candidates = np.flatnonzero(screen <= max_dist_sq)
+
+        if candidates.size == 0:
+            no_matches.append(bss_id)
+            continue
+
+        # Use find_closest() for the exact distances so that they match
+        # numpy_crossmatch() bit for bit, as the vectorised Haversine formula
+        # can differ in the last bit and flip pairs lying right on max_dist
+        min_id, min_dist = find_closest(
+            super_cat[candidates], bss_ra, bss_dec, radians=True
+        )
+
+        if min_dist > max_dist:
+            no_matches.append(bss_id)
+        else:
+            matches.append((bss_id, int(candidates[min_id]), min_dist))
+
+    return matches, no_matches
+
+
+def shrink_result(result, max_dist):
+    """
+    Derives the result of a nearest neighbour crossmatch at a smaller radius
+    from a result computed at a larger radius. The nearest neighbour of each
+    object does not depend on the radius, so matches further than max_dist
+    simply become non-matches.
+
+    Args:
+        result (tuple(list, list)): The (matches, no_matches) returned by a
+                                    crossmatch at a radius >= max_dist
+        max_dist (float): The smaller radius in degrees
+
+    Returns:
+        matches (list(tuple(int, int, float))): Matches within max_dist
+        no_matches (list(int)): Objects with no match within max_dist
+    """
+    matches, no_matches = result
+    kept = [m for m in matches if m[2] <= max_dist]
+    dropped = [m[0] for m in matches if m[2] > max_dist]
+    return kept, sorted(no_matches + dropped)
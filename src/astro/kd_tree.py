@@ -1,7 +1,14 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import src.utils.utils as utils
 from scipy.spatial import KDTree
 
+# Number of chunks handed to each worker thread by default. Several smaller
+# chunks per thread keep every thread busy when some regions of the sky are
+# denser (and so slower to query) than others.
+CHUNKS_PER_WORKER = 4
+
 
 def KD_crossmatch(bss_cat, super_cat, max_dist):
     """
@@ -28,6 +35,71 @@ def KD_crossmatch(bss_cat, super_cat, max_dist):
     return bss_tree.query_ball_tree(super_tree, r=max_dist)
 
 
+def chunk_bounds(n, workers, chunk_size=None):
+    """
+    Splits n catalogue objects into contiguous chunks to be scheduled
+    across a pool of worker threads.
+
+    Args:
+        n (int): The number of objects in the catalogue
+        workers (int): The number of worker threads
+        chunk_size (int, optional): The number of objects in each chunk.
+                                    Defaults to None, which splits the
+                                    catalogue into CHUNKS_PER_WORKER
+                                    chunks per worker.
+
+    Returns:
+        list((int, int)): The start and stop index of each chunk
+    """
+    if chunk_size is None:
+        chunk_size = -(-n // (workers * CHUNKS_PER_WORKER))
+    chunk_size = max(chunk_size, 1)
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+def threaded_KD_crossmatch(bss_cat, super_cat, max_dist, workers=None, chunk_size=None):
+    """
+    Threaded version of KD_crossmatch(). A single k-d tree is built from
+    super_cat and shared read-only between a pool of threads, each of which
+    queries the tree for a chunk of bss_cat. Threads only run in parallel
+    while SciPy's query code releases the GIL; the speed-up this gives hasn't
+    been measured yet (see thread_scaling.py).
+
+    Args:
+        bss_cat (np.ndarray): The right ascension and declination of the
+                              objects to cross-match, in radians.
+        super_cat (np.ndarray): The right ascension and declination of the
+                                objects to search for matches, in radians.
+        max_dist (float): The maximum distance to return a nearest
+                          neighbour match.
+        workers (int, optional): The number of worker threads. Defaults to
+                                 None, which uses one thread per CPU.
+        chunk_size (int, optional): The number of bss_cat objects queried
+                                    per task. Defaults to None, see
+                                    chunk_bounds().
+
+    Returns:
+        list(list(int)): For each object in bss_cat, the indexes in
+                         super_cat of the objects within max_dist, sorted
+                         in ascending order (an empty list if there are none)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    bss_cat = np.asarray(bss_cat)
+    super_tree = KDTree(super_cat)
+
+    def query_chunk(bounds):
+        start, stop = bounds
+        return super_tree.query_ball_point(
+            bss_cat[start:stop], r=max_dist, return_sorted=True
+        ).tolist()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunks = pool.map(query_chunk, chunk_bounds(len(bss_cat), workers, chunk_size))
+        return [match_idx for chunk in chunks for match_idx in chunk]
+
+
 def process_KD_crossmatch(match_indexes, bss_cat, super_cat):
     """
     Processes catalogues to return the formatted results from the
@@ -0,0 +1,266 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import src.utils.utils as utils
+
+MANIFEST = "manifest.json"
+
+# Slack in degrees added when testing whether a query can reach a shard, so
+# that rounding in the cap calculation can never drop a shard which holds a
+# match. It only costs the occasional extra shard being opened.
+CAP_SLACK = 1e-9
+
+
+def unit_vectors(ra, dec):
+    """
+    Converts right ascension and declination to unit vectors on the sphere.
+
+    Args:
+        ra (np.ndarray): right ascension in radians
+        dec (np.ndarray): declination in radians
+
+    Returns:
+        np.ndarray: (n, 3) array of unit vectors
+    """
+    return np.column_stack(
+        [np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)]
+    )
+
+
+def bounding_cap(ra, dec):
+    """
+    Finds a spherical cap (a circle on the sky) which contains every object
+    in a shard.
+
+    Args:
+        ra (np.ndarray): right ascension in radians of the shard's objects
+        dec (np.ndarray): declination in radians of the shard's objects
+
+    Returns:
+        (float, float, float): The right ascension and declination in radians
+                               of the cap centre and its radius in degrees
+    """
+    centre = unit_vectors(ra, dec).sum(axis=0)
+    centre_ra = np.arctan2(centre[1], centre[0]) % (2 * np.pi)
+    centre_dec = np.arctan2(centre[2], np.hypot(centre[0], centre[1]))
+    radius = utils.angular_dist(ra, dec, centre_ra, centre_dec, radians=True).max()
+    return float(centre_ra), float(centre_dec), float(radius)
+
+
+def shard_regions(ra, dec, n_dec):
+    """
+    Assigns each object to a sky region. The sky is split into n_dec bands
+    of declination, and each band into slices of right ascension whose
+    number shrinks with cos(Dec) so that regions have similar areas.
+
+    Args:
+        ra (np.ndarray): right ascension in radians, in [0, 2 * pi)
+        dec (np.ndarray): declination in radians
+        n_dec (int): The number of declination bands
+
+    Returns:
+        np.ndarray: (n, 2) array of the (band, slice) of each object
+    """
+    band_edges = np.linspace(-np.pi / 2, np.pi / 2, n_dec + 1)
+    band_centres = (band_edges[:-1] + band_edges[1:]) / 2
+    n_ra = np.maximum(1, np.round(2 * n_dec * np.cos(band_centres))).astype(int)
+
+    band = np.clip(np.searchsorted(band_edges, dec, side="right") - 1, 0, n_dec - 1)
+    ra_slice = np.minimum((ra / (2 * np.pi) * n_ra[band]).astype(int), n_ra[band] - 1)
+    return np.column_stack([band, ra_slice])
+
+
+def build_shards(cat, store_dir, n_dec=18):
+    """
+    Writes a catalogue to a sharded on-disk store. The catalogue is split by
+    sky region and each shard is written as binary column files of right
+    ascension, declination (both in radians) and the object's index in cat.
+    Rows within a shard are sorted by declination, which serves as the
+    shard's spatial index. A manifest records the bounding cap of each shard.
+
+    Args:
+        cat (list([float, float])): The right ascension and declination
+                                    of items in a catalogue in degrees
+        store_dir (str): Directory to write the store to
+        n_dec (int, optional): The number of declination bands to split the
+                               sky into. Defaults to 18 (10 degree bands).
+
+    Returns:
+        list(dict): The manifest entry for each shard
+    """
+    cat = np.radians(np.asarray(cat, dtype=np.float64)).reshape(-1, 2)
+    ra, dec = cat[:, 0] % (2 * np.pi), cat[:, 1]
+    ids = np.arange(len(cat))
+
+    regions = shard_regions(ra, dec, n_dec)
+
+    os.makedirs(store_dir, exist_ok=True)
+    shards = []
+
+    for b, s in np.unique(regions, axis=0).tolist():
+        in_shard = (regions[:, 0] == b) & (regions[:, 1] == s)
+        order = np.argsort(dec[in_shard], kind="stable")
+        shard_ra, shard_dec = ra[in_shard][order], dec[in_shard][order]
+
+        name = f"shard_{b:03d}_{s:03d}"
+        os.makedirs(os.path.join(store_dir, name), exist_ok=True)
+        np.save(os.path.join(store_dir, name, "ra.npy"), shard_ra)
+        np.save(os.path.join(store_dir, name, "dec.npy"), shard_dec)
+        np.save(os.path.join(store_dir, name, "ids.npy"), ids[in_shard][order])
+
+        centre_ra, centre_dec, radius = bounding_cap(shard_ra, shard_dec)
+        shards.append(
+            {
+                "name": name,
+                "count": int(in_shard.sum()),
+                "centre_ra": centre_ra,
+                "centre_dec": centre_dec,
+                "radius": radius,
+            }
+        )
+
+    with open(os.path.join(store_dir, MANIFEST), "w") as f:
+        json.dump({"n_objects": len(cat), "shards": shards}, f, indent=2)
+
+    return shards
+
+
+def load_manifest(store_dir):
+    """
+    Args:
+        store_dir (str): Directory containing a store written by build_shards()
+
+    Returns:
+        dict: The store's manifest
+    """
+    with open(os.path.join(store_dir, MANIFEST)) as f:
+        return json.load(f)
+
+
+def search_shard(store_dir, shard, bss_ra, bss_dec, max_dist):
+    """
+    Finds the closest object in a shard to each query object, provided it
+    is within max_dist. The shard's columns are memory-mapped and, for each
+    query, only the rows in the declination band which could hold a match
+    are read.
+
+    Args:
+        store_dir (str): Directory containing the store
+        shard (dict): The shard's manifest entry
+        bss_ra (np.ndarray): right ascension in radians of the query objects
+        bss_dec (np.ndarray): declination in radians of the query objects
+        max_dist (float): The maximum distance in degrees to consider a match
+
+    Returns:
+        np.ndarray: Distance in degrees to the closest object for each query,
+                    or inf if there is none within max_dist
+        np.ndarray: Index in the original catalogue of the closest object,
+                    or -1 if there is none within max_dist
+    """
+    path = os.path.join(store_dir, shard["name"])
+    ra = np.load(os.path.join(path, "ra.npy"), mmap_mode="r")
+    dec = np.load(os.path.join(path, "dec.npy"), mmap_mode="r")
+    ids = np.load(os.path.join(path, "ids.npy"), mmap_mode="r")
+
+    # |dDec| is a lower bound on the angular distance, so only rows with
+    # declination inside [dec - max_dist, dec + max_dist] can match
+    band = np.radians(max_dist + CAP_SLACK)
+    lo = np.searchsorted(dec, bss_dec - band, side="left")
+    hi = np.searchsorted(dec, bss_dec + band, side="right")
+
+    best_dist = np.full(len(bss_ra), np.inf)
+    best_id = np.full(len(bss_ra), -1, dtype=np.int64)
+
+    for i, (start, stop) in enumerate(zip(lo, hi)):
+        if start == stop:
+            continue
+
+        # Compute each distance one pair at a time, exactly as
+        # numpy_crossmatch() does, as the vectorised Haversine formula can
+        # differ in the last bit and flip pairs lying right on max_dist
+        dists = np.array(
+            [
+                utils.angular_dist(r, d, bss_ra[i], bss_dec[i], radians=True)
+                for r, d in zip(ra[start:stop], dec[start:stop])
+            ]
+        )
+        min_dist = dists.min()
+        if min_dist <= max_dist:
+            best_dist[i] = min_dist
+            # Break ties on the original index, as numpy_crossmatch() does
+            best_id[i] = ids[start:stop][dists == min_dist].min()
+
+    return best_dist, best_id
+
+
+def sharded_crossmatch(bss_cat, store_dir, max_dist, workers=None):
+    """
+    Cross-matches objects in the bss catalogue against a sharded store. The
+    manifest's bounding caps are used to find the shards each query object
+    could match in, and only those shards are opened and searched, in
+    parallel across a pool of threads. The I/O done therefore scales with the
+    area of sky covered by bss_cat rather than the size of the store.
+
+    Args:
+        bss_cat (list([float, float])): The right ascension and declination
+                                        of items in the bss catalogue in degrees
+        store_dir (str): Directory containing a store written by build_shards()
+        max_dist (float): The maximum distance in degrees to consider a match
+        workers (int, optional): The number of worker threads. Defaults to
+                                 None, which uses one thread per CPU.
+
+    Returns:
+        matches (list(tuple(int, int, float))): The index of the bss object, the
+                                                index of its nearest object in
+                                                the store's catalogue and their
+                                                distance in degrees
+        no_matches (list(int)): The indexes of bss objects with no match
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    bss_cat = np.radians(np.asarray(bss_cat, dtype=np.float64)).reshape(-1, 2)
+    bss_ra, bss_dec = bss_cat[:, 0], bss_cat[:, 1]
+    shards = load_manifest(store_dir)["shards"]
+
+    def search(shard):
+        # Only query objects within reach of the shard's bounding cap
+        reach = utils.angular_dist(
+            bss_ra, bss_dec, shard["centre_ra"], shard["centre_dec"], radians=True
+        )
+        touching = np.flatnonzero(reach <= shard["radius"] + max_dist + CAP_SLACK)
+        if touching.size == 0:
+            return touching, None, None
+
+        dists, ids = search_shard(
+            store_dir, shard, bss_ra[touching], bss_dec[touching], max_dist
+        )
+        return touching, dists, ids
+
+    best_dist = np.full(len(bss_cat), np.inf)
+    best_id = np.full(len(bss_cat), -1, dtype=np.int64)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for touching, dists, ids in pool.map(search, shards):
+            if touching.size == 0:
+                continue
+
+            # Keep the closer object, and the lower index on a tie
+            current_dist, current_id = best_dist[touching], best_id[touching]
+            closer = (dists < current_dist) | (
+                (dists == current_dist) & (ids >= 0) & (ids < current_id)
+            )
+            best_dist[touching[closer]] = dists[closer]
+            best_id[touching[closer]] = ids[closer]
+
+    matches = []
+    no_matches = []
+
+    for bss_id, (dist, super_id) in enumerate(zip(best_dist, best_id)):
+        if super_id < 0:
+            no_matches.append(bss_id)
+        else:
+            matches.append((bss_id, int(super_id), dist))
+
+    return matches, no_matches
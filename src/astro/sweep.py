@@ -0,0 +1,171 @@
+import numpy as np
+from src.astro import cross_matcher
+
+
+def offset_catalogue(cat, offset, seed=0):
+    """
+    Builds a control catalogue by moving every object a fixed angular
+    distance in a random direction. Any matches found for the control
+    catalogue are chance alignments, which estimates the number of false
+    matches at each radius.
+
+    Args:
+        cat (list([float, float])): The right ascension and declination
+                                    of items in a catalogue in degrees
+        offset (float|np.ndarray): The distance in degrees to move each
+                                   object, either one value for all objects
+                                   or one value per object
+        seed (int, optional): Seed for the random directions. Defaults to 0.
+
+    Returns:
+        list([float, float]): The offset catalogue in degrees
+    """
+    rng = np.random.default_rng(seed)
+    cat = np.radians(np.asarray(cat, dtype=np.float64)).reshape(-1, 2)
+    ra, dec = cat[:, 0], cat[:, 1]
+
+    sep = np.radians(offset)
+    bearing = rng.uniform(0, 2 * np.pi, len(cat))
+
+    # Destination point along a great circle from (ra, dec)
+    new_dec = np.arcsin(
+        np.sin(dec) * np.cos(sep) + np.cos(dec) * np.sin(sep) * np.cos(bearing)
+    )
+    new_ra = ra + np.arctan2(
+        np.sin(bearing) * np.sin(sep) * np.cos(dec),
+        np.cos(sep) - np.sin(dec) * np.sin(new_dec),
+    )
+    return np.degrees(np.column_stack([new_ra % (2 * np.pi), new_dec])).tolist()
+
+
+def sort_by_separation(result):
+    """
+    Orders a crossmatch result by separation so that the matches within any
+    radius can be found with a binary search.
+
+    Args:
+        result (tuple(list, list)): The (matches, no_matches) returned by a
+                                    crossmatch
+
+    Returns:
+        tuple(list, np.ndarray, list): The matches sorted by separation, their
+                                       separations in degrees and no_matches
+    """
+    matches, no_matches = result
+    matches = sorted(matches, key=lambda m: m[2])
+    seps = np.asarray([m[2] for m in matches], dtype=np.float64)
+    return matches, seps, list(no_matches)
+
+
+def count_matches(sweep, radii):
+    """
+    Counts the matched and unmatched objects at each radius of a sweep with
+    a binary search on the sorted separations.
+
+    Args:
+        sweep (tuple(list, np.ndarray, list)): Result of sort_by_separation()
+                                               at a radius >= max(radii)
+        radii (list(float)): The radii in degrees
+
+    Returns:
+        np.ndarray: The number of matched objects at each radius
+        np.ndarray: The number of unmatched objects at each radius
+    """
+    matches, seps, no_matches = sweep
+    n_matched = np.searchsorted(seps, np.asarray(radii, dtype=np.float64), "right")
+    return n_matched, len(matches) + len(no_matches) - n_matched
+
+
+def sweep_matches(sweep, max_dist):
+    """
+    Returns the crossmatch result at one radius of a sweep. The matches
+    within max_dist are a prefix of the sorted matches, found with a binary
+    search.
+
+    Args:
+        sweep (tuple(list, np.ndarray, list)): Result of sort_by_separation()
+                                               at a radius >= max_dist
+        max_dist (float): The radius in degrees
+
+    Returns:
+        matches (list(tuple(int, int, float))): Matches within max_dist, in
+                                                order of bss index
+        no_matches (list(int)): Objects with no match within max_dist
+    """
+    matches, seps, no_matches = sweep
+    n_matched = np.searchsorted(seps, max_dist, "right")
+    unmatched = no_matches + [m[0] for m in matches[n_matched:]]
+    return sorted(matches[:n_matched]), sorted(unmatched)
+
+
+def radius_sweep(
+    bss_cat,
+    super_cat,
+    radii,
+    func=cross_matcher.screened_crossmatch,
+    control_offset=None,
+    seed=0,
+):
+    """
+    Computes the crossmatch results for many values of max_dist from one
+    search at the largest radius. The nearest neighbour of each object does
+    not depend on the radius, so the results for every smaller radius follow
+    from the sorted separations, making a sweep cost about the same as a
+    single crossmatch.
+
+    The same sweep is run for a control catalogue (bss_cat with every object
+    moved by control_offset in a random direction) to estimate the number
+    of false matches at each radius.
+
+    Args:
+        bss_cat (list([float, float])): Catalogue to cross-match in degrees
+        super_cat (list([float, float])): Catalogue to search for matches
+                                          in degrees
+        radii (list(float)): The values of max_dist in degrees to sweep
+        func (function, optional): Crossmatch function returning (matches,
+                                   no_matches), where each match must be the
+                                   object's nearest neighbour, e.g. the
+                                   naive, numpy or screened matchers. The
+                                   k-d tree path returns the first object
+                                   found within max_dist, so can't be swept.
+                                   Defaults to
+                                   cross_matcher.screened_crossmatch.
+        control_offset (float, optional): Distance in degrees to move objects
+                                          in the control catalogue. Defaults
+                                          to None, which uses 10 * max(radii).
+        seed (int, optional): Seed for the control catalogue. Defaults to 0.
+
+    Returns:
+        list(tuple(float, int, int, int)): For each radius (in ascending
+                                           order), the radius, the number of
+                                           matched and unmatched objects and
+                                           the number of control matches
+        tuple(list, np.ndarray, list): The matches at max(radii) sorted by
+                                       separation, see sort_by_separation().
+                                       Pass it to sweep_matches() for the
+                                       pairs at any radius in the sweep.
+
+    Raises:
+        ValueError: If radii is empty
+    """
+    if len(radii) == 0:
+        raise ValueError("radius_sweep() needs at least one radius")
+
+    radii = sorted(radii)
+    max_dist = radii[-1]
+    if control_offset is None:
+        control_offset = 10 * max_dist
+
+    sweep = sort_by_separation(func(bss_cat, super_cat, max_dist))
+    control = sort_by_separation(
+        func(offset_catalogue(bss_cat, control_offset, seed), super_cat, max_dist)
+    )
+
+    n_matched, n_unmatched = count_matches(sweep, radii)
+    n_control, _ = count_matches(control, radii)
+
+    table = [
+        (r, int(m), int(u), int(c))
+        for r, m, u, c in zip(radii, n_matched, n_unmatched, n_control)
+    ]
+    return table, sweep
@@ -0,0 +1,143 @@
+"""
+Slim command line entry point which runs a single cross matching engine.
+
+Only the standard library is imported up front. NumPy, SciPy and the
+cross matching modules are imported once the chosen engine is known, so
+short jobs launched in bulk don't pay for imports they never use.
+
+Run with:
+    python -m src --engine kd --max_dist 0.0111
+"""
+import os
+import sys
+import argparse
+
+ENGINES = ("naive", "numpy", "screened", "kd", "threaded")
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line arguments.
+
+    Args:
+        argv (list(str), optional): Arguments to parse. Defaults to None,
+                                    which parses sys.argv.
+
+    Returns:
+        dict: The parsed arguments
+    """
+    ap = argparse.ArgumentParser(
+        prog="python -m src", description="Cross match two catalogues."
+    )
+    ap.add_argument(
+        "-b",
+        "--bss_path",
+        type=str,
+        default="./cats/bss.dat",
+        help="file path to bss catalogue data",
+    )
+    ap.add_argument(
+        "-s",
+        "--super_path",
+        type=str,
+        default="./cats/super.csv",
+        help="file path to SuperCosmos catalogue data",
+    )
+    ap.add_argument(
+        "-d",
+        "--max_dist",
+        type=float,
+        default=40 / 3600,
+        help="max distance between catalogue objects to consider a match",
+    )
+    ap.add_argument(
+        "-e",
+        "--engine",
+        choices=ENGINES,
+        default="kd",
+        help="cross matching algorithm to run",
+    )
+    ap.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker threads for the threaded engine",
+    )
+    return vars(ap.parse_args(argv))
+
+
+def run_engine(engine, bss_cat, super_cat, max_dist, workers=None):
+    """
+    Imports and runs a single cross matching engine.
+
+    Args:
+        engine (str): One of ENGINES
+        bss_cat (list([float, float])): Catalogue to cross-match in degrees
+        super_cat (list([float, float])): Catalogue to search for matches
+                                          in degrees
+        max_dist (float): The maximum distance to consider a match
+        workers (int, optional): Number of threads for the threaded engine.
+                                 Defaults to None (one per CPU).
+
+    Returns:
+        matches (list(tuple(int, int, float))): The index of the bss object,
+                                                the index of its match in
+                                                super_cat and their distance
+                                                in degrees
+        no_matches (list(int)): The indexes of bss objects with no match
+    """
+    if engine in ("naive", "numpy", "screened"):
+        from src.astro import cross_matcher
+
+        func = getattr(cross_matcher, f"{engine}_crossmatch")
+        return func(bss_cat, super_cat, max_dist)
+
+    import numpy as np
+    from src.astro import kd_tree
+
+    bss_cat = np.radians(np.asarray(bss_cat))
+    super_cat = np.radians(np.asarray(super_cat))
+
+    if engine == "threaded":
+        match_indexes = kd_tree.threaded_KD_crossmatch(
+            bss_cat, super_cat, max_dist, workers=workers
+        )
+    else:
+        match_indexes = kd_tree.KD_crossmatch(bss_cat, super_cat, max_dist)
+
+    return kd_tree.process_KD_crossmatch(match_indexes, bss_cat, super_cat)
+
+
+def main(argv=None):
+    """
+    Loads the catalogues, runs the chosen engine and reports the matches.
+
+    Args:
+        argv (list(str), optional): Command line arguments. Defaults to None,
+                                    which uses sys.argv.
+    """
+    args = parse_args(argv)
+
+    if not os.path.exists(args.get("bss_path")) or not os.path.exists(
+        args.get("super_path")
+    ):
+        print("[ERR] Cannot find catalogue directories.")
+        sys.exit(1)
+
+    import src.utils.utils as utils
+
+    bss_cat = utils.import_dat(args.get("bss_path"))
+    super_cat = utils.import_csv(args.get("super_path"))
+
+    matches, no_matches = run_engine(
+        args.get("engine"),
+        bss_cat,
+        super_cat,
+        args.get("max_dist"),
+        workers=args.get("workers"),
+    )
+    print(
+        f"[INFO] {args.get('engine')} method found {len(matches)} matches and "
+        f"{len(no_matches)} objects with no match"
+    )
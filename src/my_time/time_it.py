@@ -52,3 +52,32 @@ def time_method(func, **cats):
         300: time_func(func, bss_cat[:300], super_cat[:300], max_dist),
     }
     return data
+
+
+def time_workers(func, bss_cat, super_cat, max_dist, workers, repeats=3):
+    """
+    Measures the throughput of a threaded crossmatch function for different
+    numbers of worker threads.
+
+    Args:
+        func (function): Threaded crossmatch function accepting a workers kwarg
+        bss_cat (np.ndarray): Catalogue to cross-match
+        super_cat (np.ndarray): Catalogue to search for matches
+        max_dist (float): The maximum distance to consider a match
+        workers (list(int)): The thread counts to time
+        repeats (int, optional): Number of runs per thread count, of which
+                                 the fastest is kept. Defaults to 3.
+
+    Returns:
+        dict(int: float): Dictionary where keys are the number of worker
+                          threads and values are the throughput in
+                          bss_cat objects per second
+    """
+    data = {}
+    for n_workers in workers:
+        best = min(
+            time_func(lambda: func(bss_cat, super_cat, max_dist, workers=n_workers))
+            for _ in range(repeats)
+        )
+        data[n_workers] = len(bss_cat) / best
+    return data
@@ -75,6 +75,43 @@ def angular_dist(r1, d1, r2, d2, radians=False, small=False):
     return np.degrees(angle)
 
 
+def screen_dist_sq(r1, d1, r2, d2, cos_min):
+    """
+    Computes a cheap, vectorised lower bound on the squared angular distance
+    between objects. Both the right ascension and declination offsets are
+    treated as flat-sky (x, y) coordinates, with the right ascension offset
+    scaled by cos(Dec) so that it shrinks towards the poles.
+
+    The bound follows from the Haversine formula using sin(x) >= x - x**3 / 6
+    and cos(d1) * cos(d2) >= min(cos(d1), cos(d2))**2, so for any pair
+
+        screen_dist_sq(...) <= angular_dist(..., radians=True) ** 2
+
+    (with both sides in radians). A pair whose screened distance is above the
+    match radius can therefore never be a match.
+
+    Args:
+        r1 (float|np.ndarray): right ascension in radians for object 1
+        d1 (float|np.ndarray): declination in radians for object 1
+        r2 (float|np.ndarray): right ascension in radians for object 2
+        d2 (float|np.ndarray): declination in radians for object 2
+        cos_min (float|np.ndarray): min(cos(d1), cos(d2))
+
+    Returns:
+        float|np.ndarray: lower bound on the squared angular distance between
+                          object 1 and object 2 in radians squared
+    """
+    dd = np.abs(d1 - d2)
+    # Wrap the right ascension offset onto [0, pi] so that objects either
+    # side of RA = 0 are treated as neighbours
+    dr = np.abs(r1 - r2) % (2 * np.pi)
+    dr = np.minimum(dr, 2 * np.pi - dr)
+
+    a = (dd * (1 - dd**2 / 24)) ** 2
+    b = (cos_min * dr * (1 - dr**2 / 24)) ** 2
+    return a + b
+
+
 def import_dat(dat_file):
     """
     Load catalogue from fixed-width .dat file.
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import src.utils.utils as utils
 
 """
@@ -18,3 +19,60 @@ def super_cat():
 @pytest.fixture(scope="session")
 def bss_cat():
     return utils.import_dat("./cats/bss.dat")
+
+
+@pytest.fixture(scope="session")
+def stress_cats():
+    """
+    Synthetic catalogues designed to stress approximate distance measures.
+    The bss objects include points near both poles and either side of RA = 0,
+    and each has super objects scattered at separations close to 40 arcseconds
+    so that many pairs sit right on the match threshold.
+    """
+    rng = np.random.default_rng(42)
+    n_bss = 200
+
+    ra = rng.uniform(0, 360, n_bss)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, n_bss)))
+    ra[:20] = rng.choice([0.001, 359.999], 20)
+    dec[20:40] = rng.choice([-1, 1], 20) * rng.uniform(89.9, 90, 20)
+    bss_cat = np.column_stack([ra, dec])
+
+    # Offset neighbours by separations between 30 and 50 arcseconds in random
+    # directions, moving along the sphere so the offsets are true separations
+    n_near = 5
+    sep = np.radians(rng.uniform(30, 50, (n_bss, n_near)) / 3600)
+    bearing = rng.uniform(0, 2 * np.pi, (n_bss, n_near))
+    d1 = np.radians(dec)[:, None]
+    d2 = np.arcsin(
+        np.sin(d1) * np.cos(sep) + np.cos(d1) * np.sin(sep) * np.cos(bearing)
+    )
+    r2 = np.radians(ra)[:, None] + np.arctan2(
+        np.sin(bearing) * np.sin(sep) * np.cos(d1),
+        np.cos(sep) - np.sin(d1) * np.sin(d2),
+    )
+    near = np.column_stack([np.degrees(r2).ravel() % 360, np.degrees(d2).ravel()])
+
+    far = np.column_stack(
+        [rng.uniform(0, 360, 1000), np.degrees(np.arcsin(rng.uniform(-1, 1, 1000)))]
+    )
+    super_cat = rng.permutation(np.vstack([near, far]))
+
+    return bss_cat.tolist(), super_cat.tolist()
+
+
+@pytest.fixture(scope="session")
+def assert_same_crossmatch():
+    """
+    Returns a function asserting that two (matches, no_matches) crossmatch
+    results are exactly the same, down to the last bit of each distance.
+    """
+
+    def check(expected, result):
+        exp_matches, exp_no_matches = expected
+        matches, no_matches = result
+
+        assert no_matches == exp_no_matches
+        assert matches == exp_matches
+
+    return check
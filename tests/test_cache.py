@@ -0,0 +1,157 @@
+import functools
+import pytest
+import numpy as np
+from src import cli
+from src.astro import cache, cross_matcher, kd_tree
+
+
+class CountingCrossmatch:
+    """
+    Wraps a crossmatch function, numpy_crossmatch by default, counting how
+    many times it is actually run
+    """
+
+    def __init__(self, func=cross_matcher.numpy_crossmatch):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, bss_cat, super_cat, max_dist):
+        self.calls += 1
+        return self.func(bss_cat, super_cat, max_dist)
+
+
+def test_fingerprint(bss_cat):
+    assert cache.fingerprint(bss_cat) == cache.fingerprint(np.asarray(bss_cat))
+    assert cache.fingerprint(bss_cat) != cache.fingerprint(bss_cat[:-1])
+
+
+def test_cache_hit(bss_cat, super_cat):
+    func = CountingCrossmatch()
+    crossmatch = cache.CrossmatchCache().wrap(func, key="counting")
+
+    first = crossmatch(bss_cat, super_cat, 40 / 3600)
+    second = crossmatch(bss_cat, super_cat, 40 / 3600)
+
+    assert func.calls == 1
+    assert first == second
+
+
+def test_cache_shrink_radius(bss_cat, super_cat):
+    func = CountingCrossmatch()
+    crossmatch = cache.CrossmatchCache().wrap(func, key="counting", nearest=True)
+    crossmatch(bss_cat, super_cat, 60 / 3600)
+
+    for max_dist in [40 / 3600, 10 / 3600, 1 / 3600]:
+        assert crossmatch(
+            bss_cat, super_cat, max_dist
+        ) == cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist)
+    assert func.calls == 1
+
+    # A larger radius can't be derived and must be recomputed
+    crossmatch(bss_cat, super_cat, 80 / 3600)
+    assert func.calls == 2
+
+
+def test_cache_lru_eviction(bss_cat, super_cat):
+    func = CountingCrossmatch()
+    crossmatch = cache.CrossmatchCache(maxsize=2).wrap(func, key="counting")
+
+    crossmatch(bss_cat, super_cat, 40 / 3600)
+    crossmatch(bss_cat[:50], super_cat, 40 / 3600)
+    crossmatch(bss_cat[:100], super_cat, 40 / 3600)
+    assert func.calls == 3
+
+    crossmatch(bss_cat, super_cat, 40 / 3600)
+    assert func.calls == 4
+
+
+def test_cache_disk_store(bss_cat, super_cat, tmp_path):
+    func = CountingCrossmatch()
+    expected = cache.CrossmatchCache(cache_dir=tmp_path).wrap(
+        func, key="counting", nearest=True
+    )(bss_cat, super_cat, 40 / 3600)
+
+    # A fresh cache with an empty memory picks the result up from disk
+    crossmatch = cache.CrossmatchCache(cache_dir=tmp_path).wrap(
+        func, key="counting", nearest=True
+    )
+    assert crossmatch(bss_cat, super_cat, 40 / 3600) == expected
+    assert crossmatch(bss_cat, super_cat, 20 / 3600) == cross_matcher.numpy_crossmatch(
+        bss_cat, super_cat, 20 / 3600
+    )
+    assert func.calls == 1
+
+
+def test_cache_partial(bss_cat, super_cat, tmp_path):
+    func = CountingCrossmatch()
+
+    # A partial has no name of its own to key the cache on
+    with pytest.raises(TypeError):
+        cache.CrossmatchCache().wrap(functools.partial(func))(
+            bss_cat, super_cat, 40 / 3600
+        )
+
+    # An explicit key lets a new cache find the result on disk
+    cache.CrossmatchCache(cache_dir=tmp_path).wrap(
+        functools.partial(func), key="counting"
+    )(bss_cat, super_cat, 40 / 3600)
+    crossmatch = cache.CrossmatchCache(cache_dir=tmp_path).wrap(
+        functools.partial(func), key="counting"
+    )
+    crossmatch(bss_cat, super_cat, 40 / 3600)
+    assert func.calls == 1
+
+
+def test_cache_closures_need_key(bss_cat, super_cat):
+    """
+    Closures made by the same function share a __qualname__, so without a
+    key they would collide in the cache
+    """
+
+    def scaled(factor):
+        def run(bss_cat, super_cat, max_dist):
+            return cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist * factor)
+
+        return run
+
+    crossmatch_cache = cache.CrossmatchCache()
+    with pytest.raises(TypeError):
+        crossmatch_cache.wrap(scaled(1))(bss_cat, super_cat, 40 / 3600)
+    with pytest.raises(TypeError):
+        crossmatch_cache.wrap(lambda b, s, d: ([], []))(bss_cat, super_cat, 40 / 3600)
+
+    for factor in (1, 100):
+        crossmatch = crossmatch_cache.wrap(scaled(factor), key=f"scaled-{factor}")
+        assert crossmatch(bss_cat, super_cat, 40 / 3600) == (
+            cross_matcher.numpy_crossmatch(bss_cat, super_cat, 40 * factor / 3600)
+        )
+
+
+def test_cache_only_derives_nearest_neighbours(bss_cat, super_cat, tmp_path):
+    """
+    The k-d tree path returns the first object within max_dist rather than
+    the nearest, so smaller radii must be recomputed rather than derived
+    """
+    func = CountingCrossmatch(functools.partial(cli.run_engine, "kd"))
+    crossmatch = cache.CrossmatchCache(cache_dir=tmp_path).wrap(func, key="kd")
+
+    crossmatch(bss_cat, super_cat, 1.0)
+    for max_dist in (0.01, 0.05):
+        assert crossmatch(bss_cat, super_cat, max_dist) == cli.run_engine(
+            "kd", bss_cat, super_cat, max_dist
+        )
+    assert func.calls == 3
+
+    # Nor is a smaller radius derived from the results stored on disk
+    crossmatch = cache.CrossmatchCache(cache_dir=tmp_path).wrap(func, key="kd")
+    crossmatch(bss_cat, super_cat, 0.02)
+    assert func.calls == 4
+
+
+def test_cache_rejects_match_indexes(bss_cat, super_cat):
+    bss_cat = np.radians(np.asarray(bss_cat))
+    super_cat = np.radians(np.asarray(super_cat))
+    crossmatch = cache.CrossmatchCache().wrap(kd_tree.KD_crossmatch)
+
+    with pytest.raises(TypeError):
+        crossmatch(bss_cat, super_cat, 40 / 3600)
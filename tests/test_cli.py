@@ -0,0 +1,57 @@
+import sys
+import subprocess
+import pytest
+from src import cli
+
+
+def imported_modules(*args):
+    """
+    Runs python with -X importtime and returns the top-level packages which
+    were imported, along with the captured stdout
+
+    Args:
+        args (tuple(str)): Arguments to pass to python
+
+    Returns:
+        set(str): Names of the imported top-level packages
+        str: The output of the command
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules, proc.stdout
+
+
+def test_cli_startup_imports():
+    """
+    Parsing arguments must not pull in any heavy dependencies
+    """
+    modules, _ = imported_modules("-m", "src", "--help")
+    assert "src" in modules
+    assert not {"numpy", "scipy", "matplotlib"} & modules
+
+
+@pytest.mark.parametrize("engine", ["numpy", "screened"])
+def test_cli_engine_imports(engine):
+    """
+    Engines which don't use a k-d tree must not import SciPy
+    """
+    modules, out = imported_modules("-m", "src", "--engine", engine)
+    assert "151 matches and 9 objects with no match" in out
+    assert "numpy" in modules
+    assert not {"scipy", "matplotlib"} & modules
+
+
+@pytest.mark.parametrize("engine", cli.ENGINES)
+def test_run_engine(bss_cat, super_cat, engine):
+    matches, no_matches = cli.run_engine(engine, bss_cat, super_cat, 40 / 3600)
+    assert len(matches) == 151
+    assert len(no_matches) == 9
@@ -58,3 +58,43 @@ def test_naive_vs_numpy_crossmatch(bss_cat, super_cat):
     assert len(np_no_matches) == len(naive_no_matches)
     assert np.round(np_matches[3][2], 5) == np.round(naive_matches[3][2], 5)
     assert np_no_matches == naive_no_matches
+
+
+def test_numpy_vs_screened_crossmatch(bss_cat, super_cat, assert_same_crossmatch):
+    """
+    Tests that screening candidates with the flat-sky lower bound gives
+    identical results to the exact numpy implementation
+    """
+    assert_same_crossmatch(
+        cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist=40 / 3600),
+        cross_matcher.screened_crossmatch(bss_cat, super_cat, max_dist=40 / 3600),
+    )
+
+
+@pytest.mark.parametrize("max_dist", [35 / 3600, 40 / 3600, 45 / 3600, 1.0])
+def test_numpy_vs_screened_crossmatch_stress(
+    stress_cats, max_dist, assert_same_crossmatch
+):
+    """
+    Tests the screened crossmatch against the exact numpy implementation on
+    catalogues with objects near the poles, either side of RA = 0 and with
+    many pairs close to the match threshold
+    """
+    bss_cat, super_cat = stress_cats
+    assert_same_crossmatch(
+        cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist),
+        cross_matcher.screened_crossmatch(bss_cat, super_cat, max_dist),
+    )
+
+
+def test_screened_crossmatch_at_exact_threshold(bss_cat, super_cat):
+    """
+    Setting max_dist to each measured pair distance must give exactly the
+    same accept/reject decisions as numpy_crossmatch()
+    """
+    result = cross_matcher.numpy_crossmatch(bss_cat, super_cat, 40 / 3600)
+
+    for max_dist in [m[2] for m in result[0]]:
+        assert cross_matcher.screened_crossmatch(
+            bss_cat, super_cat, max_dist
+        ) == cross_matcher.shrink_result(result, max_dist)
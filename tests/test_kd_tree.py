@@ -19,3 +19,27 @@ def test_numpy_vs_kd_tree_crossmatch(bss_cat, super_cat):
     assert len(np_no_matches) == len(kd_no_matches)
     assert np_matches[:3] == kd_matches[:3]
     assert np_no_matches[:3] == kd_no_matches[:3]
+
+
+def test_chunk_bounds():
+    assert kd_tree.chunk_bounds(10, 1, chunk_size=4) == [(0, 4), (4, 8), (8, 10)]
+    assert kd_tree.chunk_bounds(0, 4) == []
+
+    bounds = kd_tree.chunk_bounds(160, 3)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 160
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (4, None), (3, 7)])
+def test_kd_tree_vs_threaded_kd_tree_crossmatch(
+    bss_cat, super_cat, workers, chunk_size
+):
+    bss_cat = np.radians(np.asarray(bss_cat))
+    super_cat = np.radians(np.asarray(super_cat))
+
+    match_indexes = kd_tree.KD_crossmatch(bss_cat, super_cat, max_dist=40 / 3600)
+    threaded_match_indexes = kd_tree.threaded_KD_crossmatch(
+        bss_cat, super_cat, 40 / 3600, workers=workers, chunk_size=chunk_size
+    )
+
+    assert [sorted(idx) for idx in match_indexes] == threaded_match_indexes
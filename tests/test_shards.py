@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+import src.utils.utils as utils
+from src.astro import cross_matcher, shards
+
+
+@pytest.fixture(scope="module")
+def super_store(super_cat, tmp_path_factory):
+    store_dir = tmp_path_factory.mktemp("super_store")
+    shards.build_shards(super_cat, store_dir)
+    return store_dir
+
+
+def test_build_shards(super_cat, super_store):
+    manifest = shards.load_manifest(super_store)
+    assert manifest["n_objects"] == len(super_cat)
+    assert sum(s["count"] for s in manifest["shards"]) == len(super_cat)
+
+    # Every object is stored once and lies inside its shard's bounding cap
+    ids = []
+    for shard in manifest["shards"]:
+        ra = np.load(super_store / shard["name"] / "ra.npy")
+        dec = np.load(super_store / shard["name"] / "dec.npy")
+        ids.extend(np.load(super_store / shard["name"] / "ids.npy"))
+
+        assert np.all(np.diff(dec) >= 0)
+        reach = utils.angular_dist(
+            ra, dec, shard["centre_ra"], shard["centre_dec"], radians=True
+        )
+        assert np.all(reach <= shard["radius"] + shards.CAP_SLACK)
+    assert sorted(ids) == list(range(len(super_cat)))
+
+
+def test_numpy_vs_sharded_crossmatch(
+    bss_cat, super_cat, super_store, assert_same_crossmatch
+):
+    assert_same_crossmatch(
+        cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist=40 / 3600),
+        shards.sharded_crossmatch(bss_cat, super_store, max_dist=40 / 3600),
+    )
+
+
+@pytest.mark.parametrize("n_dec", [1, 6, 36])
+@pytest.mark.parametrize("max_dist", [40 / 3600, 1.0])
+def test_numpy_vs_sharded_crossmatch_stress(
+    stress_cats, tmp_path, n_dec, max_dist, assert_same_crossmatch
+):
+    """
+    Tests the sharded crossmatch on catalogues with objects near the poles
+    and either side of RA = 0, where neighbours often fall in different shards
+    """
+    bss_cat, super_cat = stress_cats
+    shards.build_shards(super_cat, tmp_path, n_dec=n_dec)
+
+    assert_same_crossmatch(
+        cross_matcher.numpy_crossmatch(bss_cat, super_cat, max_dist),
+        shards.sharded_crossmatch(bss_cat, tmp_path, max_dist, workers=2),
+    )
+
+
+def test_sharded_crossmatch_opens_touched_shards(super_cat, super_store, monkeypatch):
+    """
+    A query confined to a small patch of sky only searches nearby shards
+    """
+    searched = []
+    search_shard = shards.search_shard
+
+    def counting_search_shard(store_dir, shard, *args):
+        searched.append(shard["name"])
+        return search_shard(store_dir, shard, *args)
+
+    monkeypatch.setattr(shards, "search_shard", counting_search_shard)
+    matches, _ = shards.sharded_crossmatch([super_cat[268]], super_store, 40 / 3600)
+    assert matches[0][1] == 268
+
+    n_shards = len(shards.load_manifest(super_store)["shards"])
+    assert 0 < len(searched) < n_shards
+
+
+def test_sharded_crossmatch_at_exact_threshold(bss_cat, super_cat, super_store):
+    """
+    Setting max_dist to each measured pair distance must give exactly the
+    same accept/reject decisions as numpy_crossmatch()
+    """
+    result = cross_matcher.numpy_crossmatch(bss_cat, super_cat, 40 / 3600)
+
+    for max_dist in [m[2] for m in result[0]]:
+        assert shards.sharded_crossmatch(
+            bss_cat, super_store, max_dist, workers=1
+        ) == cross_matcher.shrink_result(result, max_dist)
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+import src.utils.utils as utils
+from src.astro import cross_matcher, sweep
+
+
+def test_offset_catalogue(bss_cat):
+    control = sweep.offset_catalogue(bss_cat, 0.1)
+    bss = np.asarray(bss_cat)
+    control = np.asarray(control)
+
+    dists = utils.angular_dist(bss[:, 0], bss[:, 1], control[:, 0], control[:, 1])
+    assert np.allclose(dists, 0.1)
+
+
+def test_offset_catalogue_per_object(bss_cat):
+    offsets = np.linspace(1, 60, len(bss_cat)) / 3600
+    control = np.asarray(sweep.offset_catalogue(bss_cat, offsets, seed=3))
+    bss = np.asarray(bss_cat)
+
+    dists = utils.angular_dist(bss[:, 0], bss[:, 1], control[:, 0], control[:, 1])
+    assert np.allclose(dists, offsets)
+    assert np.all((control[:, 0] >= 0) & (control[:, 0] < 360))
+
+
+def test_radius_sweep_no_radii(bss_cat, super_cat):
+    with pytest.raises(ValueError):
+        sweep.radius_sweep(bss_cat, super_cat, [])
+
+
+def test_radius_sweep_vs_numpy_crossmatch(bss_cat, super_cat):
+    radii = [r / 3600 for r in (40, 1, 5, 20, 60)]
+    table, result = sweep.radius_sweep(bss_cat, super_cat, radii)
+    control_cat = sweep.offset_catalogue(bss_cat, 10 * max(radii))
+
+    assert [row[0] for row in table] == sorted(radii)
+    for max_dist, n_matched, n_unmatched, n_control in table:
+        matches, no_matches = cross_matcher.numpy_crossmatch(
+            bss_cat, super_cat, max_dist
+        )
+        assert (n_matched, n_unmatched) == (len(matches), len(no_matches))
+        assert sweep.sweep_matches(result, max_dist) == (
+            cross_matcher.screened_crossmatch(bss_cat, super_cat, max_dist)
+        )
+
+        control_matches, _ = cross_matcher.numpy_crossmatch(
+            control_cat, super_cat, max_dist
+        )
+        assert n_control == len(control_matches)
+
+    assert table[3][1:3] == (151, 9)
+
+
+def test_radius_sweep_control(stress_cats):
+    """
+    The stress catalogues have neighbours 30-50 arcseconds from every bss
+    object, so a control offset of 40 arcseconds finds chance matches
+    """
+    bss_cat, super_cat = stress_cats
+    radii = [r / 3600 for r in (5, 10, 20, 40)]
+    table, _ = sweep.radius_sweep(bss_cat, super_cat, radii, control_offset=40 / 3600)
+    control_cat = sweep.offset_catalogue(bss_cat, 40 / 3600)
+
+    n_control = [row[3] for row in table]
+    assert n_control[-1] > 0
+    for max_dist, n in zip(radii, n_control):
+        matches, _ = cross_matcher.numpy_crossmatch(control_cat, super_cat, max_dist)
+        assert n == len(matches)
@@ -26,6 +26,17 @@ def test_angular_dist():
     assert np.round(utils.angular_dist(r1, d1, r2, d2, radians=True), 3) == 8.100
 
 
+def test_screen_dist_sq_is_lower_bound():
+    rng = np.random.default_rng(0)
+    r1, r2 = rng.uniform(0, 2 * np.pi, (2, 10000))
+    d1, d2 = np.arcsin(rng.uniform(-1, 1, (2, 10000)))
+    cos_min = np.minimum(np.cos(d1), np.cos(d2))
+
+    screen = utils.screen_dist_sq(r1, d1, r2, d2, cos_min)
+    true = np.radians(utils.angular_dist(r1, d1, r2, d2, radians=True))
+    assert np.all(screen <= true**2 * (1 + 1e-12))
+
+
 # def test_import_dat
 
 
@@ -0,0 +1,82 @@
+"""
+Benchmarks the throughput of the threaded k-d tree crossmatch against the
+number of worker threads. The catalogues are enlarged by scattering copies
+of each object across the (RA, Dec) plane searched by the k-d tree, so that
+each thread has enough work to do.
+"""
+import os
+import argparse
+import sys
+import numpy as np
+from src.my_time import time_it
+from src.astro import kd_tree
+import src.utils.utils as utils
+
+if __name__ == "__main__":
+
+    print("[INFO] Script started successfully")
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "-b",
+        "--bss_path",
+        type=str,
+        default="./cats/bss.dat",
+        help="file path to bss catalogue data",
+    )
+    ap.add_argument(
+        "-s",
+        "--super_path",
+        type=str,
+        default="./cats/super.csv",
+        help="file path to SuperCosmos catalogue data",
+    )
+    ap.add_argument(
+        "-n",
+        "--copies",
+        type=int,
+        default=2000,
+        help="number of randomly offset copies of each catalogue to search",
+    )
+    ap.add_argument(
+        "-w",
+        "--max_workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="largest number of worker threads to benchmark",
+    )
+    args = vars(ap.parse_args())
+
+    try:
+        bss_cat = np.radians(np.asarray(utils.import_dat(args.get("bss_path"))))
+        super_cat = np.radians(np.asarray(utils.import_csv(args.get("super_path"))))
+    except FileNotFoundError:
+        print("[ERR] Catalogues not found at filepath.")
+        sys.exit()
+
+    print("[INFO] Loaded catalogue data")
+
+    # Shift each copy of the catalogues by the same random offset so that
+    # matching pairs stay together
+    rng = np.random.default_rng(0)
+    offsets = rng.uniform(0, 2 * np.pi, (args.get("copies"), 1, 2))
+    bss_cat = (bss_cat + offsets).reshape(-1, 2)
+    super_cat = (super_cat + offsets).reshape(-1, 2)
+
+    workers = [1]
+    while workers[-1] * 2 <= args.get("max_workers"):
+        workers.append(workers[-1] * 2)
+    if workers[-1] != args.get("max_workers"):
+        workers.append(args.get("max_workers"))
+
+    print(
+        f"[INFO] Starting thread scaling benchmark with {len(bss_cat)} objects "
+        f"searched against {len(super_cat)} objects"
+    )
+    throughput = time_it.time_workers(
+        kd_tree.threaded_KD_crossmatch, bss_cat, super_cat, 40 / 3600, workers
+    )
+
+    print("\tthreads \t objects/s \t speed-up")
+    for n_workers, rate in throughput.items():
+        print(f"\t{n_workers} \t\t {rate:.0f} \t {rate / throughput[1]:.2f}")
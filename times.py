@@ -5,7 +5,6 @@ time and plotting execution time.
 """
 import argparse
 import sys
-import matplotlib.pyplot as plt
 from src.my_time import time_it
 from src.astro import cross_matcher, kd_tree
 import src.utils.utils as utils
@@ -36,6 +35,11 @@ if __name__ == "__main__":
         default="./figs/output.png",
         help="file path to output figure",
     )
+    ap.add_argument(
+        "--no_plot",
+        action="store_true",
+        help="print the timings instead of plotting them",
+    )
     args = vars(ap.parse_args())
 
     try:
@@ -59,6 +63,19 @@ if __name__ == "__main__":
     )
     kd_cross_matcher_times = time_it.time_method(kd_tree.KD_crossmatch, **cats)
 
+    if args.get("no_plot"):
+        print("\tsize \t naive \t\t\t numpy \t\t\t k-d tree")
+        for size in naive_cross_matcher_times:
+            print(
+                f"\t{size} \t {naive_cross_matcher_times[size]} \t "
+                f"{numpy_cross_matcher_times[size]} \t {kd_cross_matcher_times[size]}"
+            )
+        sys.exit()
+
+    # Plotting is optional (see requirements-plot.txt) so only import
+    # matplotlib once we know it's needed
+    import matplotlib.pyplot as plt
+
     print("[INFO] Plotting results")
 
     # Plot the results